@@ -34,25 +34,60 @@
 # =========================================================================
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import re
+from operator import itemgetter
 import os
 import sys
+import time
+from dataclasses import dataclass
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    # Fall back to the standard library when orjson is not installed
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
 
 # =========================================================================
 # LOGIN configuration
 # =========================================================================
-SWITCH_URL = "https://YOUR-SWITCH-IP/command-api"
-USERNAME = "ADD-YOUR-USERNAME"
-PASSWORD = "ADD-YOUR-PASSWORD"
+# Values can be overridden with the ARISTA_SRT_* environment variables,
+# which are read once when the script is loaded
+SWITCH_URL = os.environ.get("ARISTA_SRT_URL", "https://YOUR-SWITCH-IP/command-api")
+USERNAME = os.environ.get("ARISTA_SRT_USERNAME", "ADD-YOUR-USERNAME")
+PASSWORD = os.environ.get("ARISTA_SRT_PASSWORD", "ADD-YOUR-PASSWORD")
+
+
+# =========================================================================
+# HTTP session
+# =========================================================================
+# A single session keeps the TLS connection to the switch alive between
+# eAPI calls instead of paying a new handshake for every request.
+HEADERS = {'Content-Type': 'application/json'}
+
+
+def create_session(username, password):
+    session = requests.Session()
+    session.auth = (username, password)
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
+
+_session = create_session(USERNAME, PASSWORD)
 
 
 # =========================================================================
 # JSON executions
 # =========================================================================
-def execute_command(commands):
-    headers = {'Content-Type': 'application/json'}
+def execute_command(commands, url=SWITCH_URL, session=_session):
     payload = {
         "jsonrpc": "2.0",
         "method": "runCmds",
@@ -64,15 +99,13 @@ def execute_command(commands):
         "id": 1
     }
     try:
-        response = requests.post(
-            SWITCH_URL,
-            headers=headers,
-            data=json.dumps(payload),
-            auth=(USERNAME, PASSWORD),
+        response = session.post(
+            url,
+            data=_dumps(payload),
             timeout=20
         )
         response.raise_for_status()
-        result = response.json()
+        result = _loads(response.content)
         if 'error' in result:
             raise Exception(f"API error: {result['error']}")
         return result
@@ -80,33 +113,92 @@ def execute_command(commands):
         raise Exception("Connection timed out while trying to reach the switch.")
     except requests.RequestException as e:
         raise Exception(f"Network error: {e}")
-    except json.JSONDecodeError:
+    except ValueError:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
         raise Exception("Invalid JSON response from the switch.")
 
 
+# =========================================================================
+# FETCH all switch data
+# =========================================================================
+# Every eAPI command needed for the report, in the order of the results
+# returned by fetch_all()
+REPORT_COMMANDS = [
+    "show version",
+    "show hostname",
+    "show interfaces counters rates",
+    "show interfaces counters errors",
+    "show environment all",
+]
+
+# Seconds a fetched snapshot is reused before the switch is queried again
+FETCH_CACHE_TTL = 30
+
+# Switch URL -> (expiry time, eAPI results)
+_fetch_cache = {}
+
+
+def fetch_all(url=SWITCH_URL, session=_session, refresh=False):
+    now = time.monotonic()
+    cached = _fetch_cache.get(url)
+    if cached and not refresh and now < cached[0]:
+        return cached[1]
+
+    response = execute_command(REPORT_COMMANDS, url, session)
+    results = response['result']
+    _fetch_cache[url] = (now + FETCH_CACHE_TTL, results)
+    return results
+
+
 # =========================================================================
 # TIME format
 # =========================================================================
+SECONDS_PER_WEEK = 7 * 24 * 60 * 60
+SECONDS_PER_DAY = 24 * 60 * 60
+SECONDS_PER_HOUR = 60 * 60
+
+
 def format_uptime(seconds):
-    weeks = seconds // (7 * 24 * 60 * 60)
-    days = (seconds % (7 * 24 * 60 * 60)) // (24 * 60 * 60)
-    hours = (seconds % (24 * 60 * 60)) // 3600
-    minutes = (seconds % 3600) // 60
+    weeks, remainder = divmod(seconds, SECONDS_PER_WEEK)
+    days, remainder = divmod(remainder, SECONDS_PER_DAY)
+    hours, remainder = divmod(remainder, SECONDS_PER_HOUR)
+    minutes = remainder // 60
     return f"{weeks} weeks, {days} days, {hours} hours and {minutes} minutes"
 
 
 # =========================================================================
-# GET switch informations
+# ESCAPE text for HTML
+# =========================================================================
+# Same replacements as html.escape(quote=True), applied with one C-level pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def escape_html(text):
+    return text.translate(HTML_ESCAPE_TABLE)
+
+
 # =========================================================================
-def get_switch_info():
-    commands = ["show version", "show hostname"]
-    response = execute_command(commands)
+# SHORTEN interface names
+# =========================================================================
+def shorten_interface_name(name):
+    # "Ethernet1/1" -> "Eth1/1", any other name is returned untouched
+    if name.startswith("Ethernet"):
+        return "Eth" + name[8:]
+    return name
 
-    version_info = response['result'][0]
-    hostname_info = response['result'][1]
 
+# =========================================================================
+# GET switch informations
+# =========================================================================
+def get_switch_info(version_info, hostname_info):
     bootup_timestamp = version_info.get("bootupTimestamp", 0)
-    current_timestamp = datetime.now().timestamp()
+    current_timestamp = time.time()
     uptime_seconds = int(current_timestamp - bootup_timestamp)
 
     return {
@@ -125,39 +217,51 @@ def get_switch_info():
 # =========================================================================
 # GET interface counters
 # =========================================================================
-def get_interface_counters():
-    response_rates = execute_command(["show interfaces counters rates"])
-    response_errors = execute_command(["show interfaces counters errors"])
-
-    interfaces_rates = response_rates['result'][0]['interfaces']
-    interfaces_errors = response_errors['result'][0]['interfaceErrorCounters']
+# Error counters reported per port, in the order they appear in the table
+ERROR_KEYS = (
+    "inErrors",
+    "outErrors",
+    "frameTooLongs",
+    "frameTooShorts",
+    "fcsErrors",
+    "alignmentErrors",
+    "symbolErrors",
+)
+ERROR_DEFAULTS = dict.fromkeys(ERROR_KEYS, 0)
+_get_errors = itemgetter(*ERROR_KEYS)
+
+
+# Per-port record; the error fields follow the order of ERROR_KEYS
+@dataclass(slots=True)
+class PortStats:
+    description: str
+    outBpsRate: float
+    inBpsRate: float
+    totalErrors: int
+    inErrors: int
+    outErrors: int
+    frameTooLongs: int
+    frameTooShorts: int
+    fcsErrors: int
+    alignmentErrors: int
+    symbolErrors: int
+
+
+def get_interface_counters(rates_info, errors_info):
+    interfaces_rates = rates_info['interfaces']
+    interfaces_errors = errors_info['interfaceErrorCounters']
 
     combined_data = {}
     for port, rate_data in interfaces_rates.items():
-        modified_port = port.replace("Ethernet", "Eth")
-        error_data = interfaces_errors.get(port, {})
-        total_errors = sum([
-            error_data.get("inErrors", 0),
-            error_data.get("outErrors", 0),
-            error_data.get("frameTooLongs", 0),
-            error_data.get("frameTooShorts", 0),
-            error_data.get("fcsErrors", 0),
-            error_data.get("alignmentErrors", 0),
-            error_data.get("symbolErrors", 0)
-        ])
-        combined_data[modified_port] = {
-            "description": rate_data.get("description", ""),
-            "outBpsRate": rate_data.get("outBpsRate", 0),
-            "inBpsRate": rate_data.get("inBpsRate", 0),
-            "totalErrors": total_errors,
-            "inErrors": error_data.get("inErrors", 0),
-            "outErrors": error_data.get("outErrors", 0),
-            "frameTooLongs": error_data.get("frameTooLongs", 0),
-            "frameTooShorts": error_data.get("frameTooShorts", 0),
-            "fcsErrors": error_data.get("fcsErrors", 0),
-            "alignmentErrors": error_data.get("alignmentErrors", 0),
-            "symbolErrors": error_data.get("symbolErrors", 0),
-        }
+        modified_port = shorten_interface_name(port)
+        error_values = _get_errors({**ERROR_DEFAULTS, **interfaces_errors.get(port, {})})
+        combined_data[modified_port] = PortStats(
+            rate_data.get("description", ""),
+            rate_data.get("outBpsRate", 0),
+            rate_data.get("inBpsRate", 0),
+            sum(error_values),
+            *error_values
+        )
 
     return combined_data
 
@@ -165,11 +269,26 @@ def get_interface_counters():
 # =========================================================================
 # GET environment informations
 # =========================================================================
-def get_environment_info():
-    commands = ["show environment all"]
-    response = execute_command(commands)
-    env_info = response['result'][0]
-
+# One compiled pattern for every line of interest in "show environment all".
+# Each alternative is wrapped in a named group so the match tells us which
+# kind of line was found; separators are limited to spaces/tabs so a match
+# never runs across line boundaries.
+ENVIRONMENT_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<cooling>System cooling status is:[ \t]*(?P<cooling_status>\w+))"
+    r"|(?P<temp>Ambient temperature:[ \t]*(?P<temp_value>\d+)C)"
+    r"|(?P<airflow>Airflow:[ \t]*(?P<airflow_value>\S(?:.*\S)?))"
+    r"|(?P<fan>(?P<fan_label>[^-\s]\S*)[ \t]+(?P<fan_state>\w+)[ \t]+"
+    r"(?P<fan_configured>\d+)%[ \t]+(?P<fan_actual>\d+)%)"
+    r"|(?P<psu>(?P<psu_label>[^-\s]\S*)[ \t]+(?P<psu_model>[\w-]+)[ \t]+"
+    r"(?P<psu_capacity>\d+W)[ \t]+(?P<psu_input>[\d.]+A)[ \t]+"
+    r"(?P<psu_output>[\d.]+A)[ \t]+(?P<psu_power>[\d.]+W)[ \t]+(?P<psu_state>\w+))"
+    r")",
+    re.MULTILINE
+)
+
+
+def get_environment_info(env_info):
     messages = env_info.get("messages", [])
     if not messages:
         return {
@@ -181,9 +300,6 @@ def get_environment_info():
 
     message_str = messages[0]
 
-    # Split the result into lines
-    lines = message_str.splitlines()
-
     # Initialize variables
     cooling_status = "N/A"
     ambient_temperature = "N/A"
@@ -191,77 +307,44 @@ def get_environment_info():
     fan_status_list = []
     power_supply_status_list = []
 
-    # Flags to indicate which table we're parsing
-    parsing_fan = False
-    parsing_power = False
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+    # Single scan over the whole message, dispatching on the matched group
+    for match in ENVIRONMENT_RE.finditer(message_str):
+        kind = match.lastgroup
 
         # GET Cooling Status
-        cooling_match = re.match(r"System cooling status is:\s*(\w+)", line)
-        if cooling_match:
-            cooling_status = cooling_match.group(1)
-            continue
+        if kind == "cooling":
+            cooling_status = match.group("cooling_status")
 
         # GET Ambient Temperature
-        temp_match = re.match(r"Ambient temperature:\s*(\d+)C", line)
-        if temp_match:
-            ambient_temperature = f"{temp_match.group(1)}C"
-            continue
+        elif kind == "temp":
+            ambient_temperature = f"{match.group('temp_value')}C"
 
         # GET Airflow
-        airflow_match = re.match(r"Airflow:\s*(.+)", line)
-        if airflow_match:
-            airflow = airflow_match.group(1)
-            continue
-
-        # Detect the start of the Fan Status table
-        if line.startswith("Fan") and "Status" in line:
-            parsing_fan = True
-            parsing_power = False
-            continue
-
-        # Detect the start of the Power Supply Status table
-        if line.startswith("Power") and "Supply" in line:
-            parsing_power = True
-            parsing_fan = False
-            continue
-
-        # Skip table headers
-        if re.match(r"[-\s]+", line):
-            continue
+        elif kind == "airflow":
+            airflow = match.group("airflow_value")
 
         # Parse Fan Status entries
-        if parsing_fan:
-            fan_match = re.match(r"(\S+)\s+(\w+)\s+(\d+)%\s+(\d+)%", line)
-            if fan_match:
-                fan_label = fan_match.group(1).replace("Ethernet", "Eth")
-                status = fan_match.group(2)
-                configured_speed = fan_match.group(3)
-                actual_speed = fan_match.group(4)
-                fan_status_list.append(
-                    f"<strong>{fan_label} Status:</strong> {status}, <strong>Configured Speed:</strong> {configured_speed}%, <strong>Actual Speed:</strong> {actual_speed}%"
-                )
-            continue
+        elif kind == "fan":
+            fan_label = escape_html(shorten_interface_name(match.group("fan_label")))
+            status = match.group("fan_state")
+            configured_speed = match.group("fan_configured")
+            actual_speed = match.group("fan_actual")
+            fan_status_list.append(
+                f"<strong>{fan_label} Status:</strong> {status}, <strong>Configured Speed:</strong> {configured_speed}%, <strong>Actual Speed:</strong> {actual_speed}%"
+            )
 
         # Parse Power Supply Status entries
-        if parsing_power:
-            power_match = re.match(r"(\S+)\s+([\w-]+)\s+(\d+W)\s+([\d\.]+A)\s+([\d\.]+A)\s+([\d\.]+W)\s+(\w+)", line)
-            if power_match:
-                supply_label = power_match.group(1).replace("Ethernet", "Eth")
-                model = power_match.group(2)
-                capacity = power_match.group(3)
-                input_current = power_match.group(4)
-                output_current = power_match.group(5)
-                power = power_match.group(6)
-                status = power_match.group(7)
-                power_supply_status_list.append(
-                    f"<strong>{supply_label} Status:</strong> {status}, <strong>Model:</strong> {model}, <strong>Capacity:</strong> {capacity}, <strong>Input Current:</strong> {input_current}, <strong>Output Current:</strong> {output_current}, <strong>Power:</strong> {power}"
-                )
-            continue
+        elif kind == "psu":
+            supply_label = escape_html(shorten_interface_name(match.group("psu_label")))
+            model = match.group("psu_model")
+            capacity = match.group("psu_capacity")
+            input_current = match.group("psu_input")
+            output_current = match.group("psu_output")
+            power = match.group("psu_power")
+            status = match.group("psu_state")
+            power_supply_status_list.append(
+                f"<strong>{supply_label} Status:</strong> {status}, <strong>Model:</strong> {model}, <strong>Capacity:</strong> {capacity}, <strong>Input Current:</strong> {input_current}, <strong>Output Current:</strong> {output_current}, <strong>Power:</strong> {power}"
+            )
 
     # If no fan or power supply data was parsed, set to N/A
     if not fan_status_list:
@@ -282,137 +365,131 @@ def get_environment_info():
 # =========================================================================
 # SORT ethernet interfaces
 # =========================================================================
-def sort_eth_interfaces(interfaces):
-    eth_interfaces = {
-        port: data for port, data in interfaces.items() if port.startswith("Eth")
-    }
+DIGITS_RE = re.compile(r'\d+')
+
+
+_find_digits = DIGITS_RE.findall
 
-    def interface_sort_key(interface_name):
-        parts = re.findall(r'\d+', interface_name)
-        return [int(part) for part in parts]
 
+def interface_sort_key(item):
+    # (port, data) -> (1, 1) for "Eth1/1", computed once per port by sorted()
+    return tuple(map(int, _find_digits(item[0])))
+
+
+def sort_eth_interfaces(interfaces):
     return sorted(
-        eth_interfaces.items(),
-        key=lambda x: interface_sort_key(x[0])
+        (item for item in interfaces.items() if item[0].startswith("Eth")),
+        key=interface_sort_key
     )
 
 
 # =========================================================================
-# ARRANGE data for interface statistics and charts
+# GENERATE interface rows for statistics table
 # =========================================================================
-def prepare_interface_data(sorted_interfaces):
-    labels = [port for port, _ in sorted_interfaces]
-    port_numbers = [int(re.findall(r'\d+', port)[0]) for port in labels]
+INTERFACE_ROW = (
+    "<tr><th scope='row'>{number}</th><td>{port}</td><td>{description}</td>"
+    "<td>{out_mbps:.2f}</td><td>{in_mbps:.2f}</td>"
+    "<td>{stats.inErrors}</td><td>{stats.outErrors}</td>"
+    "<td>{stats.frameTooLongs}</td><td>{stats.frameTooShorts}</td>"
+    "<td>{stats.fcsErrors}</td><td>{stats.alignmentErrors}</td>"
+    "<td>{stats.symbolErrors}</td></tr>"
+).format
+
+
+def generate_interface_row(index, port, data, in_mbps, out_mbps):
+    return INTERFACE_ROW(
+        number=index + 1,
+        port=port,
+        description=escape_html(data.description),
+        out_mbps=out_mbps,
+        in_mbps=in_mbps,
+        stats=data
+    )
 
-    in_bps_data = [
-        data['inBpsRate'] / 1_000_000 if data['inBpsRate'] else 0
-        for _, data in sorted_interfaces
-    ]
-    out_bps_data = [
-        data['outBpsRate'] / 1_000_000 if data['outBpsRate'] else 0
-        for _, data in sorted_interfaces
-    ]
 
-    # Error data arrays
-    in_errors_data = [data.get('inErrors', 0) for _, data in sorted_interfaces]
-    out_errors_data = [data.get('outErrors', 0) for _, data in sorted_interfaces]
-    frame_too_longs_data = [data.get('frameTooLongs', 0) for _, data in sorted_interfaces]
-    frame_too_shorts_data = [data.get('frameTooShorts', 0) for _, data in sorted_interfaces]
-    fcs_errors_data = [data.get('fcsErrors', 0) for _, data in sorted_interfaces]
-    alignment_errors_data = [data.get('alignmentErrors', 0) for _, data in sorted_interfaces]
-    symbol_errors_data = [data.get('symbolErrors', 0) for _, data in sorted_interfaces]
+# =========================================================================
+# BUILD interface statistics and chart tables
+# =========================================================================
+@dataclass(slots=True)
+class ReportTables:
+    chart_data: dict
+    html_rows: str
 
-    # Calculate total errors per port
-    total_errors_data = [data.get('totalErrors', 0) for _, data in sorted_interfaces]
 
-    # Similarly for other data arrays
-    return {
-        "labels": labels,
-        "port_numbers": port_numbers,
-        "in_bps_data": in_bps_data,
-        "out_bps_data": out_bps_data,
-        "in_errors_data": in_errors_data,
-        "out_errors_data": out_errors_data,
-        "frame_too_longs_data": frame_too_longs_data,
-        "frame_too_shorts_data": frame_too_shorts_data,
-        "fcs_errors_data": fcs_errors_data,
-        "alignment_errors_data": alignment_errors_data,
-        "symbol_errors_data": symbol_errors_data,
-        "total_errors_data": total_errors_data,
+def build_report_tables(interfaces):
+    sorted_interfaces = sort_eth_interfaces(interfaces)
+
+    traffic_data = []
+    error_data = []
+    pie_data = []
+    html_rows = []
+
+    # Build every chart entry and table row in a single pass over the interfaces
+    for index, (port, data) in enumerate(sorted_interfaces):
+        port_label = f"Eth{DIGITS_RE.search(port).group()}"
+        # Converted once, shared by the traffic chart and the table row
+        in_mbps = data.inBpsRate / 1_000_000 if data.inBpsRate else 0
+        out_mbps = data.outBpsRate / 1_000_000 if data.outBpsRate else 0
+        traffic_data.append({
+            "port_number": port_label,
+            "InBpsRate": in_mbps,
+            "OutBpsRate": out_mbps
+        })
+        error_data.append({
+            "port_number": port_label,
+            "InErrors": data.inErrors,
+            "OutErrors": data.outErrors,
+            "FrameTooLongs": data.frameTooLongs,
+            "FrameTooShorts": data.frameTooShorts,
+            "FCSErrors": data.fcsErrors,
+            "AlignmentErrors": data.alignmentErrors,
+            "SymbolErrors": data.symbolErrors
+        })
+        if data.totalErrors > 0:  # Exclude ports with 0 errors
+            pie_data.append({"port": port_label, "totalErrors": data.totalErrors})
+        html_rows.append(generate_interface_row(index, port, data, in_mbps, out_mbps))
+
+    chart_data = {
+        "traffic": traffic_data,
+        "errors": error_data,
+        "pie": pie_data,
     }
 
+    return ReportTables(chart_data=chart_data, html_rows=''.join(html_rows))
+
 
 # =========================================================================
-# GENERATE interface rows for statistics table
+# HTML report template
 # =========================================================================
-def generate_interface_rows(sorted_interfaces):
-    rows = ''
-    for index, (port, data) in enumerate(sorted_interfaces):
-        row = (
-            f"<tr><th scope='row'>{index + 1}</th><td>{port}</td><td>{data['description']}</td>"
-            f"<td>{data['outBpsRate'] / 1_000_000:.2f}</td><td>{data['inBpsRate'] / 1_000_000:.2f}</td>"
-            f"<td>{data.get('inErrors', 0)}</td><td>{data.get('outErrors', 0)}</td>"
-            f"<td>{data.get('frameTooLongs', 0)}</td><td>{data.get('frameTooShorts', 0)}</td>"
-            f"<td>{data.get('fcsErrors', 0)}</td><td>{data.get('alignmentErrors', 0)}</td>"
-            f"<td>{data.get('symbolErrors', 0)}</td></tr>"
-        )
-        rows += row
-    return rows
+# List items for the switch and environment panels
+KEY_VALUE_ITEM = "<li class='list-group-item'><strong>{}:</strong> {}</li>".format
+STATUS_ITEM = "<li class='list-group-item'>{}</li>".format
 
 
-# =========================================================================
-# GENERATE html report
-# ========================================================================= 
-def generate_html_report():
-    switch_info = get_switch_info()
-    interface_counters = get_interface_counters()
-    environment_info = get_environment_info()
-
-    sorted_eth_interfaces = sort_eth_interfaces(interface_counters)
-
-    data = prepare_interface_data(sorted_eth_interfaces)
-    interface_rows = generate_interface_rows(sorted_eth_interfaces)
-
-    traffic_chart_data = json.dumps([
-        {
-            "port_number": f"Eth{data['port_numbers'][i]}",
-            "InBpsRate": data['in_bps_data'][i],
-            "OutBpsRate": data['out_bps_data'][i]
-        } for i in range(len(data['labels']))
-    ])
-
-    error_chart_data = json.dumps([
-        {
-            "port_number": f"Eth{data['port_numbers'][i]}",
-            "InErrors": data['in_errors_data'][i],
-            "OutErrors": data['out_errors_data'][i],
-            "FrameTooLongs": data['frame_too_longs_data'][i],
-            "FrameTooShorts": data['frame_too_shorts_data'][i],
-            "FCSErrors": data['fcs_errors_data'][i],
-            "AlignmentErrors": data['alignment_errors_data'][i],
-            "SymbolErrors": data['symbol_errors_data'][i]
-        } for i in range(len(data['labels']))
-    ])
-
-    pie_chart_data = [
-        {"port": f"Eth{data['port_numbers'][i]}", "totalErrors": data["total_errors_data"][i]}
-        for i, (port, _) in enumerate(sorted_eth_interfaces)
-        if data["total_errors_data"][i] > 0  # Exclude ports with 0 errors
-    ]
-    pie_chart_json = json.dumps(pie_chart_data)
+def render_status_items(items):
+    # Status entries already carry their own markup, see get_environment_info()
+    return ''.join(map(STATUS_ITEM, items or []))
+
 
-    html_content = f"""
+# Static page chrome and the dynamic fragments are kept apart: the
+# constants below are joined with the rendered pieces in document order by
+# generate_html_report(). Only the *_TMPL constants go through str.format(),
+# so only they need literal braces doubled; CHARTS_JS uses %-style holes so
+# the chart code can keep its braces as written.
+REPORT_HEAD_TMPL = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
-        <title>Switch Report - {switch_info['FQDN']}</title>
+        <title>Switch Report - {fqdn}</title>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
 
-        <script src="https://cdn.amcharts.com/lib/5/index.js"></script>
-        <script src="https://cdn.amcharts.com/lib/5/percent.js"></script>
-        <script src="https://cdn.amcharts.com/lib/5/themes/Animated.js"></script>
-        <script src="https://cdn.amcharts.com/lib/5/xy.js"></script>
+        <link rel="preconnect" href="https://cdn.amcharts.com">
+
+        <script defer src="https://cdn.amcharts.com/lib/5/index.js"></script>
+        <script defer src="https://cdn.amcharts.com/lib/5/percent.js"></script>
+        <script defer src="https://cdn.amcharts.com/lib/5/themes/Animated.js"></script>
+        <script defer src="https://cdn.amcharts.com/lib/5/xy.js"></script>
 
         <link rel="stylesheet" href="assets/css/style.css">
         <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
@@ -421,7 +498,7 @@ def generate_html_report():
         <header class="bg-light py-3">
             <div class="container-xxl d-flex justify-content-between align-items-center">
                 <img src="assets/img/logo_arista.webp" class="logo-header" alt="Arista Logo">
-                <span class="badge text-bg-warning">{switch_info['FQDN']}</span>
+                <span class="badge text-bg-warning">{fqdn}</span>
             </div>
         </header>
 
@@ -430,17 +507,25 @@ def generate_html_report():
                 <div class="col-md-4">
                     <h3>Switch Information</h3>
                     <ul class="list-group">
-                        {''.join(f"<li class='list-group-item'><strong>{key}:</strong> {value}</li>" for key, value in switch_info.items())}
+                        """
+
+REPORT_ENVIRONMENT_HTML = """
                     </ul>
                 </div>
                 <div class="col-md-4">
                     <h3>Environment Status</h3>
                     <ul class="list-group">
-                        {''.join(f"<li class='list-group-item'><strong>{key}:</strong> {value}</li>" for key, value in environment_info.items() if key not in ["Fan Status", "Power Supply Status"])}
+                        """
+
+REPORT_FAN_STATUS_HTML = """
                         <li class='list-group-item'><strong>Fan Status:</strong></li>
-                        {''.join(f"<li class='list-group-item'>{status}</li>" for status in environment_info.get("Fan Status", []))}
+                        """
+
+REPORT_POWER_SUPPLY_HTML = """
                         <li class='list-group-item'><strong>Power Supply Status:</strong></li>
-                        {''.join(f"<li class='list-group-item'>{status}</li>" for status in environment_info.get("Power Supply Status", []))}
+                        """
+
+REPORT_TABLE_HTML = """
                     </ul>
                 </div>
                 <div class="col-md-4">
@@ -479,17 +564,19 @@ def generate_html_report():
                     </tr>
                 </thead>
                 <tbody>
-                    {interface_rows}
+                    """
+
+REPORT_FOOTER_TMPL = """
                 </tbody>
             </table>
-            <p class="footer-report">Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p class="footer-report">Report generated on: {report_timestamp}</p>
         </div>
         <footer class="bg-light py-4">
             <div class="container-xxl">
                 <div class="row">
                     <!-- Left Column -->
                     <div class="col-md-8 mb-3">
-                        <p>&copy; {datetime.now().year} Matia Zanella. All rights reserved.</p>
+                        <p>&copy; {year} Matia Zanella. All rights reserved.</p>
                         <p>Find the project on <a href="https://github.com/akamura/arista-srt" target="_blank">GitHub</a></p>
                         <p>This program is free software; you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation; either version 2 of the License, or (at your option) any later version. You are free and encouraged to contribute on GitHub.</p>
                     </div>
@@ -518,250 +605,349 @@ def generate_html_report():
                 </div>
             </div>
         </footer>
-        <script>
-            am5.ready(function() {{
-                var rootTraffic = am5.Root.new("portTrafficChart");
-                rootTraffic.setThemes([
-                    am5themes_Animated.new(rootTraffic)
-                ]);
-                var chartTraffic = rootTraffic.container.children.push(
-                    am5xy.XYChart.new(rootTraffic, {{
-                        panX: true,
-                        panY: false,
-                        wheelX: "panX",
-                        wheelY: "zoomX",
-                        pinchZoomX: true,
-                        zoomOutButton: am5.Button.new(rootTraffic, {{
-                            x: am5.percent(95),
-                            y: am5.percent(0),
-                            centerX: am5.percent(50),
-                            centerY: am5.percent(0),
-                            label: am5.Label.new(rootTraffic, {{ text: "Reset Zoom" }})
-                        }})
-                    }})
-                );
-
-                chartTraffic.zoomOutButton.events.on("click", function() {{
-                    chartTraffic.goHome();
-                }});
-
-                var xRendererTraffic = am5xy.AxisRendererX.new(rootTraffic, {{ minGridDistance: 20 }});
-                xRendererTraffic.labels.template.setAll({{
-                    rotation: -45,
-                    centerY: am5.p50,
-                    centerX: am5.p100,
-                    oversizedBehavior: "truncate",
-                    fontSize: 12
-                }});
-
-                var xAxisTraffic = chartTraffic.xAxes.push(
-                    am5xy.CategoryAxis.new(rootTraffic, {{
-                        maxDeviation: 0,
-                        categoryField: "port_number",
-                        renderer: xRendererTraffic,
-                        tooltip: am5.Tooltip.new(rootTraffic, {{ themeTags: ["axis"] }})
-                    }})
-                );
-
-                var yAxisTraffic = chartTraffic.yAxes.push(
-                    am5xy.ValueAxis.new(rootTraffic, {{
-                        renderer: am5xy.AxisRendererY.new(rootTraffic, {{}}),
-                        tooltip: am5.Tooltip.new(rootTraffic, {{ themeTags: ["axis"] }})
-                    }})
-                );
-
-                var dataTraffic = {traffic_chart_data};
-
-                xAxisTraffic.data.setAll(dataTraffic);
-
-                function makeSeriesTraffic(name, fieldName, color) {{
-                    var series = chartTraffic.series.push(
-                        am5xy.ColumnSeries.new(rootTraffic, {{
-                            name: name,
-                            xAxis: xAxisTraffic,
-                            yAxis: yAxisTraffic,
-                            valueYField: fieldName,
-                            categoryXField: "port_number",
-                            tooltip: am5.Tooltip.new(rootTraffic, {{
-                                labelText: "{{{{name}}}} on Port {{{{port_number}}}}: {{{{valueY}}}} Mbps"
-                            }}),
-                            fill: color,
-                            stroke: color
-                        }})
+"""
+
+CHARTS_JS = """        <script>
+            // amCharts is loaded with defer, so wait until it has run
+            document.addEventListener("DOMContentLoaded", function() {
+                am5.ready(function() {
+                    var rootTraffic = am5.Root.new("portTrafficChart");
+                    rootTraffic.setThemes([
+                        am5themes_Animated.new(rootTraffic)
+                    ]);
+                    var chartTraffic = rootTraffic.container.children.push(
+                        am5xy.XYChart.new(rootTraffic, {
+                            panX: true,
+                            panY: false,
+                            wheelX: "panX",
+                            wheelY: "zoomX",
+                            pinchZoomX: true,
+                            zoomOutButton: am5.Button.new(rootTraffic, {
+                                x: am5.percent(95),
+                                y: am5.percent(0),
+                                centerX: am5.percent(50),
+                                centerY: am5.percent(0),
+                                label: am5.Label.new(rootTraffic, { text: "Reset Zoom" })
+                            })
+                        })
+                    );
+
+                    chartTraffic.zoomOutButton.events.on("click", function() {
+                        chartTraffic.goHome();
+                    });
+
+                    var xRendererTraffic = am5xy.AxisRendererX.new(rootTraffic, { minGridDistance: 20 });
+                    xRendererTraffic.labels.template.setAll({
+                        rotation: -45,
+                        centerY: am5.p50,
+                        centerX: am5.p100,
+                        oversizedBehavior: "truncate",
+                        fontSize: 12
+                    });
+
+                    var xAxisTraffic = chartTraffic.xAxes.push(
+                        am5xy.CategoryAxis.new(rootTraffic, {
+                            maxDeviation: 0,
+                            categoryField: "port_number",
+                            renderer: xRendererTraffic,
+                            tooltip: am5.Tooltip.new(rootTraffic, { themeTags: ["axis"] })
+                        })
+                    );
+
+                    var yAxisTraffic = chartTraffic.yAxes.push(
+                        am5xy.ValueAxis.new(rootTraffic, {
+                            renderer: am5xy.AxisRendererY.new(rootTraffic, {}),
+                            tooltip: am5.Tooltip.new(rootTraffic, { themeTags: ["axis"] })
+                        })
+                    );
+
+                    var dataTraffic = %(traffic)s;
+
+                    xAxisTraffic.data.setAll(dataTraffic);
+
+                    function makeSeriesTraffic(name, fieldName, color) {
+                        var series = chartTraffic.series.push(
+                            am5xy.ColumnSeries.new(rootTraffic, {
+                                name: name,
+                                xAxis: xAxisTraffic,
+                                yAxis: yAxisTraffic,
+                                valueYField: fieldName,
+                                categoryXField: "port_number",
+                                tooltip: am5.Tooltip.new(rootTraffic, {
+                                    labelText: "{{name}} on Port {{port_number}}: {{valueY}} Mbps"
+                                }),
+                                fill: color,
+                                stroke: color
+                            })
+                        );
+
+                        series.columns.template.setAll({
+                            width: am5.percent(80)
+                        });
+
+                        series.data.setAll(dataTraffic);
+
+                        series.appear();
+
+                        legendTraffic.data.push(series);
+                    }
+
+                    var legendTraffic = chartTraffic.children.push(am5.Legend.new(rootTraffic, {
+                        centerX: am5.p50,
+                        x: am5.p50
+                    }));
+
+                    makeSeriesTraffic("In Rate (Mbps)", "InBpsRate", am5.color("#0455BF"));
+                    makeSeriesTraffic("Out Rate (Mbps)", "OutBpsRate", am5.color("#2E97F2"));
+
+                    chartTraffic.appear(1000, 100);
+
+                    var rootError = am5.Root.new("portErrorChart");
+                    rootError.setThemes([
+                        am5themes_Animated.new(rootError)
+                    ]);
+
+                    var chartError = rootError.container.children.push(
+                        am5xy.XYChart.new(rootError, {
+                            panX: true,
+                            panY: false,
+                            wheelX: "panX",
+                            wheelY: "zoomX",
+                            pinchZoomX: true,
+                            zoomOutButton: am5.Button.new(rootError, {
+                                x: am5.percent(95),
+                                y: am5.percent(0),
+                                centerX: am5.percent(50),
+                                centerY: am5.percent(0),
+                                label: am5.Label.new(rootError, { text: "Reset Zoom" })
+                            })
+                        })
+                    );
+
+                    chartError.zoomOutButton.events.on("click", function() {
+                        chartError.goHome();
+                    });
+
+                    var xRendererError = am5xy.AxisRendererX.new(rootError, { minGridDistance: 20 });
+                    xRendererError.labels.template.setAll({
+                        rotation: -45,
+                        centerY: am5.p50,
+                        centerX: am5.p100,
+                        oversizedBehavior: "truncate",
+                        fontSize: 12
+                    });
+
+                    var xAxisError = chartError.xAxes.push(
+                        am5xy.CategoryAxis.new(rootError, {
+                            maxDeviation: 0,
+                            categoryField: "port_number",
+                            renderer: xRendererError,
+                            tooltip: am5.Tooltip.new(rootError, { themeTags: ["axis"] })
+                        })
+                    );
+
+                    var yAxisError = chartError.yAxes.push(
+                        am5xy.ValueAxis.new(rootError, {
+                            renderer: am5xy.AxisRendererY.new(rootError, {}),
+                            tooltip: am5.Tooltip.new(rootError, { themeTags: ["axis"] })
+                        })
+                    );
+
+                    var dataError = %(error)s;
+
+                    xAxisError.data.setAll(dataError);
+
+                    function makeSeriesError(name, fieldName, color) {
+                        var series = chartError.series.push(
+                            am5xy.ColumnSeries.new(rootError, {
+                                name: name,
+                                xAxis: xAxisError,
+                                yAxis: yAxisError,
+                                valueYField: fieldName,
+                                categoryXField: "port_number",
+                                tooltip: am5.Tooltip.new(rootError, {
+                                    labelText: "{{name}} on Port {{port_number}}: {{valueY}}"
+                                }),
+                                fill: color,
+                                stroke: color
+                            })
+                        );
+
+                        series.columns.template.setAll({
+                            width: am5.percent(80)
+                        });
+
+                        series.data.setAll(dataError);
+
+                        series.appear();
+
+                        legendError.data.push(series);
+                    }
+
+                    var legendError = chartError.children.push(am5.Legend.new(rootError, {
+                        centerX: am5.p50,
+                        x: am5.p50
+                    }));
+
+                    makeSeriesError("In Errors", "InErrors", am5.color("#E51C1F"));
+                    makeSeriesError("Out Errors", "OutErrors", am5.color("#F18EA8"));
+                    makeSeriesError("Frame Too Longs", "FrameTooLongs", am5.color("#F2CC0C"));
+                    makeSeriesError("Frame Too Shorts", "FrameTooShorts", am5.color("#C626AF"));
+                    makeSeriesError("FCS Errors", "FCSErrors", am5.color("#FF460E"));
+                    makeSeriesError("Alignment Errors", "AlignmentErrors", am5.color("#8C533E"));
+                    makeSeriesError("Symbol Errors", "SymbolErrors", am5.color("#0A1B26"));
+
+                    chartError.appear(1000, 100);
+
+                    var rootPie = am5.Root.new("errorPieChart");
+
+                    rootPie.setThemes([
+                        am5themes_Animated.new(rootPie)
+                    ]);
+
+                    var chartPie = rootPie.container.children.push(
+                        am5percent.PieChart.new(rootPie, {
+                            layout: rootPie.verticalLayout
+                        })
                     );
 
-                    series.columns.template.setAll({{
-                        width: am5.percent(80)
-                    }});
-
-                    series.data.setAll(dataTraffic);
-
-                    series.appear();
-
-                    legendTraffic.data.push(series);
-                }}
-
-                var legendTraffic = chartTraffic.children.push(am5.Legend.new(rootTraffic, {{
-                    centerX: am5.p50,
-                    x: am5.p50
-                }}));
-
-                makeSeriesTraffic("In Rate (Mbps)", "InBpsRate", am5.color("#0455BF"));
-                makeSeriesTraffic("Out Rate (Mbps)", "OutBpsRate", am5.color("#2E97F2"));
-
-                chartTraffic.appear(1000, 100);
-
-                var rootError = am5.Root.new("portErrorChart");
-                rootError.setThemes([
-                    am5themes_Animated.new(rootError)
-                ]);
-
-                var chartError = rootError.container.children.push(
-                    am5xy.XYChart.new(rootError, {{
-                        panX: true,
-                        panY: false,
-                        wheelX: "panX",
-                        wheelY: "zoomX",
-                        pinchZoomX: true,
-                        zoomOutButton: am5.Button.new(rootError, {{
-                            x: am5.percent(95),
-                            y: am5.percent(0),
-                            centerX: am5.percent(50),
-                            centerY: am5.percent(0),
-                            label: am5.Label.new(rootError, {{ text: "Reset Zoom" }})
-                        }})
-                    }})
-                );
-
-                chartError.zoomOutButton.events.on("click", function() {{
-                    chartError.goHome();
-                }});
-
-                var xRendererError = am5xy.AxisRendererX.new(rootError, {{ minGridDistance: 20 }});
-                xRendererError.labels.template.setAll({{
-                    rotation: -45,
-                    centerY: am5.p50,
-                    centerX: am5.p100,
-                    oversizedBehavior: "truncate",
-                    fontSize: 12
-                }});
-
-                var xAxisError = chartError.xAxes.push(
-                    am5xy.CategoryAxis.new(rootError, {{
-                        maxDeviation: 0,
-                        categoryField: "port_number",
-                        renderer: xRendererError,
-                        tooltip: am5.Tooltip.new(rootError, {{ themeTags: ["axis"] }})
-                    }})
-                );
-
-                var yAxisError = chartError.yAxes.push(
-                    am5xy.ValueAxis.new(rootError, {{
-                        renderer: am5xy.AxisRendererY.new(rootError, {{}}),
-                        tooltip: am5.Tooltip.new(rootError, {{ themeTags: ["axis"] }})
-                    }})
-                );
-
-                var dataError = {error_chart_data};
-
-                xAxisError.data.setAll(dataError);
-
-                function makeSeriesError(name, fieldName, color) {{
-                    var series = chartError.series.push(
-                        am5xy.ColumnSeries.new(rootError, {{
-                            name: name,
-                            xAxis: xAxisError,
-                            yAxis: yAxisError,
-                            valueYField: fieldName,
-                            categoryXField: "port_number",
-                            tooltip: am5.Tooltip.new(rootError, {{
-                                labelText: "{{{{name}}}} on Port {{{{port_number}}}}: {{{{valueY}}}}"
-                            }}),
-                            fill: color,
-                            stroke: color
-                        }})
+                    var colorSet = am5.ColorSet.new(rootPie, {
+                        colors: [
+                            am5.color(0xE51C1F),
+                            am5.color(0xF18EA8),
+                            am5.color(0xF2CC0C),
+                            am5.color(0xC626AF),
+                            am5.color(0xFF460E),
+                            am5.color(0x8C533E),
+                            am5.color(0x0A1B26),
+                            am5.color(0x008080),
+                            am5.color(0x00BFFF),
+                            am5.color(0xDC143C)
+                        ]
+                    });
+
+                    var seriesPie = chartPie.series.push(
+                        am5percent.PieSeries.new(rootPie, {
+                            valueField: "totalErrors",
+                            categoryField: "port",
+                            tooltipText: "{{category}}: {{value}} Errors",
+                            colors: colorSet  // Apply the color set
+                        })
                     );
 
-                    series.columns.template.setAll({{
-                        width: am5.percent(80)
-                    }});
-
-                    series.data.setAll(dataError);
-
-                    series.appear();
-
-                    legendError.data.push(series);
-                }}
-
-                var legendError = chartError.children.push(am5.Legend.new(rootError, {{
-                    centerX: am5.p50,
-                    x: am5.p50
-                }}));
-
-                makeSeriesError("In Errors", "InErrors", am5.color("#E51C1F"));
-                makeSeriesError("Out Errors", "OutErrors", am5.color("#F18EA8"));
-                makeSeriesError("Frame Too Longs", "FrameTooLongs", am5.color("#F2CC0C"));
-                makeSeriesError("Frame Too Shorts", "FrameTooShorts", am5.color("#C626AF"));
-                makeSeriesError("FCS Errors", "FCSErrors", am5.color("#FF460E"));
-                makeSeriesError("Alignment Errors", "AlignmentErrors", am5.color("#8C533E"));
-                makeSeriesError("Symbol Errors", "SymbolErrors", am5.color("#0A1B26"));
-
-                chartError.appear(1000, 100);
-
-                var rootPie = am5.Root.new("errorPieChart");
-
-                rootPie.setThemes([
-                    am5themes_Animated.new(rootPie)
-                ]);
-
-                var chartPie = rootPie.container.children.push(
-                    am5percent.PieChart.new(rootPie, {{
-                        layout: rootPie.verticalLayout
-                    }})
-                );
-
-                var colorSet = am5.ColorSet.new(rootPie, {{
-                    colors: [
-                        am5.color(0xE51C1F),
-                        am5.color(0xF18EA8),
-                        am5.color(0xF2CC0C),
-                        am5.color(0xC626AF),
-                        am5.color(0xFF460E),
-                        am5.color(0x8C533E),
-                        am5.color(0x0A1B26),
-                        am5.color(0x008080),
-                        am5.color(0x00BFFF),
-                        am5.color(0xDC143C)
-                    ]
-                }});
-
-                var seriesPie = chartPie.series.push(
-                    am5percent.PieSeries.new(rootPie, {{
-                        valueField: "totalErrors",
-                        categoryField: "port",
-                        tooltipText: "{{{{category}}}}: {{{{value}}}} Errors",
-                        colors: colorSet  // Apply the color set
-                    }})
-                );
-
-                seriesPie.data.setAll({pie_chart_json});
-                seriesPie.appear(1000, 100);
-                chartPie.appear(1000, 100);
-
-            }});
+                    seriesPie.data.setAll(%(pie)s);
+                    seriesPie.appear(1000, 100);
+                    chartPie.appear(1000, 100);
+
+                });
+            });
         </script>
     </body>
     </html>
     """
-    formatted_datetime = datetime.now().strftime('%Y-%d-%m-%H-%M')
-    with open(f"{switch_info['FQDN']}-{formatted_datetime}-report.html", 'w', encoding='utf-8') as f:
-        f.write(html_content)
+
+
+# =========================================================================
+# GENERATE html report
+# ========================================================================= 
+def generate_html_report(url=SWITCH_URL, session=_session, refresh=False):
+    now = datetime.now()
+    report_timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+    file_timestamp = now.strftime('%Y-%d-%m-%H-%M')
+
+    version_info, hostname_info, rates_info, errors_info, env_info = fetch_all(url, session, refresh)
+
+    switch_info = get_switch_info(version_info, hostname_info)
+    interface_counters = get_interface_counters(rates_info, errors_info)
+    environment_info = get_environment_info(env_info)
+
+    tables = build_report_tables(interface_counters)
+    data = tables.chart_data
+    interface_rows = tables.html_rows
+
+    traffic_chart_data = _dumps(data['traffic']).decode('utf-8')
+    error_chart_data = _dumps(data['errors']).decode('utf-8')
+    pie_chart_json = _dumps(data['pie']).decode('utf-8')
+
+    environment_summary = {
+        key: value for key, value in environment_info.items()
+        if key not in ["Fan Status", "Power Supply Status"]
+    }
+
+    # Fragments in document order; written out one by one below
+    report_parts = [
+        REPORT_HEAD_TMPL.format(fqdn=escape_html(switch_info['FQDN'])),
+        ''.join(map(KEY_VALUE_ITEM, switch_info.keys(), map(escape_html, switch_info.values()))),
+        REPORT_ENVIRONMENT_HTML,
+        ''.join(map(KEY_VALUE_ITEM, environment_summary.keys(), map(escape_html, environment_summary.values()))),
+        REPORT_FAN_STATUS_HTML,
+        render_status_items(environment_info.get("Fan Status")),
+        REPORT_POWER_SUPPLY_HTML,
+        render_status_items(environment_info.get("Power Supply Status")),
+        REPORT_TABLE_HTML,
+        interface_rows,
+        REPORT_FOOTER_TMPL.format(report_timestamp=report_timestamp, year=now.year),
+        CHARTS_JS % {
+            'traffic': traffic_chart_data,
+            'error': error_chart_data,
+            'pie': pie_chart_json,
+        },
+    ]
+    report_file = f"{switch_info['FQDN']}-{file_timestamp}-report.html"
+    # Stream the fragments through a binary buffer instead of joining and
+    # encoding the whole document in memory first
+    with open(report_file, 'wb', buffering=256 * 1024) as f:
+        for part in report_parts:
+            f.write(part.encode('utf-8'))
+
+    return report_file
+
+
+# =========================================================================
+# GENERATE reports for multiple switches
+# =========================================================================
+def build_report(host, username, password):
+    # Each switch gets its own session so worker threads never share one
+    session = create_session(username, password)
+    try:
+        return generate_html_report(f"https://{host}/command-api", session)
+    finally:
+        session.close()
+
+
+def generate_reports(hosts, username=USERNAME, password=PASSWORD, max_workers=16):
+    # Only needed for multi-switch runs, so it is not imported at module load
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The work is network bound, so threads overlap the switch round-trips
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            host: executor.submit(build_report, host, username, password)
+            for host in hosts
+        }
+
+    results = {}
+    for host, future in futures.items():
+        try:
+            results[host] = future.result()
+        except Exception as e:
+            results[host] = e
+    return results
 
 
 # =========================================================================
 # MAIN function
 # =========================================================================
 def main():
+    hosts = sys.argv[1:]
+    if hosts:
+        for host, result in generate_reports(hosts).items():
+            if isinstance(result, Exception):
+                print(f"Error generating report for {host}: {result}")
+            else:
+                print(f"Report generated successfully for {host}")
+        return
+
     try:
         generate_html_report()
         print("Report generated successfully")